@@ -2,9 +2,20 @@ import sys
 import os
 import json
 import random
+import re
+import functools
+import types
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import threading
-from ultralytics import YOLO
+import numpy as np
+
+try:
+    # Optional: orjson parses/serializes several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
 
 from PySide6 import QtCore as qtc
 from PySide6 import QtGui as qtg
@@ -24,6 +35,145 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+IMAGE_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg'))
+
+_YOLO = None
+
+def get_yolo_class():
+    """ Imports ultralytics on first use: it pulls in torch, which takes seconds and is only needed for Auto-Detect """
+    global _YOLO
+    if _YOLO is None:
+        from ultralytics import YOLO
+        _YOLO = YOLO
+    return _YOLO
+
+# {(model path, device, half): loaded YOLO model}, kept between Auto-Detect runs.
+# Ultralytics fixes a model's device and precision on its first predict(), hence one model per setting.
+_YOLO_MODELS = {}
+_YOLO_MODELS_LOCK = threading.Lock()
+
+def get_yolo_model(load_path, device='cpu', half=False):
+    """ Loads a YOLO model once and reuses it: reading the weights costs more than a single prediction """
+    key = (load_path, str(device), bool(half))
+    with _YOLO_MODELS_LOCK:
+        model = _YOLO_MODELS.get(key)
+        if model is None:
+            model = get_yolo_class()(load_path)
+            _YOLO_MODELS[key] = model
+        return model
+
+def drop_yolo_model(load_path, device='cpu', half=False):
+    """ Forgets a pooled model (e.g. after it failed on its device), so the next request reloads it """
+    with _YOLO_MODELS_LOCK:
+        _YOLO_MODELS.pop((load_path, str(device), bool(half)), None)
+
+# "name , id" with optional extra fields; [^\S\n] is whitespace that stays on the line
+_CLASS_LINE_RE = re.compile(r'^[^\S\n]*([^,\n]*?)[^\S\n]*,[^\S\n]*([-+]?\d+)[^\S\n]*(?:,[^\n]*)?$', re.M)
+
+@functools.lru_cache(maxsize=None)
+def load_class_map(path):
+    """ Parses an id_list.txt ("name,id" per line) once per path into read-only ({name: id}, {id: name}) """
+    classes_map, id_to_name_map = {}, {}
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            text = f.read()
+        # The regex does the trimming and integer validation; lines that don't match are skipped
+        for name, cid in _CLASS_LINE_RE.findall(text):
+            cid = int(cid)
+            classes_map[name] = cid
+            id_to_name_map[cid] = name
+    # Read-only views: the cached maps are shared by every caller
+    return types.MappingProxyType(classes_map), types.MappingProxyType(id_to_name_map)
+
+def parse_json(raw):
+    """ Parses JSON bytes (uses orjson when available) """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def read_json(path):
+    """ Reads and parses a JSON file """
+    with open(path, 'rb') as f:
+        return parse_json(f.read())
+
+# Annotation files are written compact: stdlib json can only pretty-print with its slow
+# pure-Python encoder. Set to True for human-readable (indented) files.
+PRETTY_JSON = False
+
+def write_json(path, data, pretty=None):
+    """
+    Serializes data to a JSON file in a single buffered write.
+    Writes to a temporary file first and swaps it in, so a crash never leaves a half-written file.
+    pretty=None follows PRETTY_JSON.
+    """
+    if pretty is None: pretty = PRETTY_JSON
+    # orjson only accepts string keys; box ids are ints in memory
+    data = {str(k): v for k, v in data.items()}
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    elif pretty:
+        raw = json.dumps(data, indent=4).encode()
+    else:
+        raw = json.dumps(data, separators=(',', ':')).encode()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+
+def json_names_for(image_files):
+    """Returns the JSON sidecar file name for every image name, in the same order."""
+    return [os.path.splitext(image_filename)[0] + ".json" for image_filename in image_files]
+
+def copy_box_entry(entry):
+    """ Copies one annotation entry deep enough for in-place edits (the box list is the only nested value) """
+    entry = dict(entry)
+    entry['box'] = list(entry['box'])
+    return entry
+
+def file_tracks(data):
+    """ {track_id: class_id} of one parsed annotation file (last entry wins) """
+    tracks = {}
+    for val in data.values():
+        if 'track_id' in val:
+            tracks[val['track_id']] = val.get('class')
+    return tracks
+
+def interpolate_keyframes(frame_indices, boxes):
+    """
+    Linearly interpolates every gap of a track in one pass.
+    frame_indices: sorted keyframe indices (K,); boxes: their [x1, y1, x2, y2] boxes (K, 4).
+    Returns (segments, targets, interp): for each in-between frame, the index of its starting
+    keyframe, its frame index and its (4,) box row.
+    """
+    kf = np.asarray(frame_indices, dtype=np.int64)
+    b = np.asarray(boxes, dtype=np.float64)
+    steps = np.diff(kf)
+    counts = steps - 1 # frames strictly inside each gap (0 for adjacent keyframes)
+    segments = np.repeat(np.arange(len(steps)), counts)
+    # Position of every in-between frame inside its gap: 1 .. steps-1
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    step = np.arange(len(segments)) - offsets + 1
+    t = step / steps[segments]
+    interp = b[segments] + (b[segments + 1] - b[segments]) * t[:, None]
+    return segments, kf[segments] + step, interp
+
+def iou_matrix(boxes_a, boxes_b):
+    """
+    Intersection over union of every box pair, in one vectorized pass.
+    boxes_a: (N, 4), boxes_b: (M, 4) as [x1, y1, x2, y2]. Returns an (N, M) float64 array;
+    pairs whose union is empty get 0.
+    """
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    iw = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0])
+    ih = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1])
+    inter = np.maximum(iw, 0) * np.maximum(ih, 0)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(union != 0, inter / union, 0.0)
+
 def apply_dark_theme(app):
     app.setStyle("Fusion")
     palette = qtg.QPalette()
@@ -42,17 +192,49 @@ def apply_dark_theme(app):
     palette.setColor(qtg.QPalette.HighlightedText, qtg.Qt.black)
     app.setPalette(palette)
 
+# Colors are deterministic per track, so each one is only computed once: {track_id: QColor}
+_COLOR_CACHE = {}
+
 def get_color_for_id(track_id):
     if track_id is None or track_id <= 0:
         return qtg.QColor(200, 200, 200)
-    
-    random.seed(track_id)
-    # Range 100-255 ensures brighter, more vivid colors
-    return qtg.QColor(
-        random.randint(100, 255), 
-        random.randint(100, 255), 
-        random.randint(100, 255)
-    )
+
+    color = _COLOR_CACHE.get(track_id)
+    if color is None:
+        # Private generator seeded by the track id: same colors as before,
+        # without reseeding the global random state on every call
+        rng = random.Random(track_id)
+        # Range 100-255 ensures brighter, more vivid colors
+        color = qtg.QColor(
+            rng.randint(100, 255), 
+            rng.randint(100, 255), 
+            rng.randint(100, 255)
+        )
+        _COLOR_CACHE[track_id] = color
+    return color
+
+# Box outline pens per track, shared by all BoxItems: {track_id: QPen}
+_PEN_CACHE = {}
+_TRANSPARENT_BRUSH = qtg.QBrush(qtg.Qt.transparent)
+
+_ICON_CACHE = {}
+
+def get_icon_for_id(track_id):
+    """ 16x16 color swatch for the object lists, shared by every row of the same track """
+    icon = _ICON_CACHE.get(track_id)
+    if icon is None:
+        pix = qtg.QPixmap(16, 16)
+        pix.fill(get_color_for_id(track_id))
+        icon = qtg.QIcon(pix)
+        _ICON_CACHE[track_id] = icon
+    return icon
+
+def get_pen_for_id(track_id):
+    pen = _PEN_CACHE.get(track_id)
+    if pen is None:
+        pen = qtg.QPen(get_color_for_id(track_id), 7)
+        _PEN_CACHE[track_id] = pen
+    return pen
 
 class CreateObjectDialog(qtw.QDialog):
     """Dialog to prompt user for Class and Track ID before drawing."""
@@ -66,7 +248,7 @@ class CreateObjectDialog(qtw.QDialog):
         layout.addWidget(qtw.QLabel("Select Class:"))
         self.combo_classes = qtw.QComboBox()
         for name, cid in self.classes.items():
-            self.combo_classes.addItem(f"{name} ({cid})", cid)
+            self.combo_classes.addItem(f"{name} ({cid})", (cid, name))
         layout.addWidget(self.combo_classes)
         
         layout.addWidget(qtw.QLabel("Track ID:"))
@@ -81,9 +263,9 @@ class CreateObjectDialog(qtw.QDialog):
         layout.addWidget(btns)
 
     def get_data(self):
-        cid = self.combo_classes.currentData()
+        # No classes loaded (id_list.txt missing or empty): nothing is selected
+        cid, class_name = self.combo_classes.currentData() or (None, '')
         tid = self.spin_track.value()
-        class_name = self.combo_classes.currentText().split(' (')[0]
         return cid, tid, class_name
 
 # =============================================================================
@@ -97,83 +279,200 @@ class AnnotationManager:
         self.current_json_path = ""
         # Store all unique tracks found in the folder: {track_id: class_id}
         self.folder_unique_tracks = {} 
+        # scan_folder cache: {json_path: (mtime_ns, size, {track_id: class_id})}
+        self._scan_cache = {}
+        # Inverted scan cache: {track_id: {json_path, ...}}; both cover only _indexed_folder
+        self._track_files = {}
+        self._indexed_folder = None
+        # Parsed file contents: {json_path: ((mtime_ns, size), data)}, shared by loads, scans and global edits;
+        # dropped with the index when another folder is opened
+        self._parsed_cache = {}
+        # Guards the caches above: InterpolateWorker reads and updates them from its thread
+        self._cache_lock = threading.RLock()
+
+    def _parse_one_json(self, path):
+        """Returns (data, {track_id: class_id}) of one JSON file (None if unreadable)."""
+        try:
+            data = read_json(path)
+            return data, file_tracks(data)
+        except: return None
+
+    def _read_parsed(self, path, st):
+        """Returns the parsed contents of path, re-reading it only if st shows it changed."""
+        key = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            cached = self._parsed_cache.get(path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+        data = read_json(path)
+        with self._cache_lock:
+            self._parsed_cache[path] = (key, data)
+        return data
+
+    def read_file(self, path):
+        """
+        Parsed contents of an annotation file, from the cache while the file is unchanged.
+        Read-only: the dict is shared with the cache. Raises OSError if the file is missing.
+        """
+        return self._read_parsed(path, os.stat(path))
+
+    def _store_written(self, path, data):
+        """Records data as the current contents of path right after writing it (no re-read needed)."""
+        st = os.stat(path)
+        tracks = file_tracks(data)
+        with self._cache_lock:
+            self._parsed_cache[path] = ((st.st_mtime_ns, st.st_size), data)
+            # A write that lands after another folder was opened must stay out of its index
+            if os.path.dirname(path) == self._indexed_folder:
+                self._index_file(path, st.st_mtime_ns, st.st_size, tracks)
+
+    def _index_file(self, path, mtime, size, tracks):
+        """Sets the scan cache entry of one file and keeps the track -> files map in step."""
+        self._unindex_file(path)
+        self._scan_cache[path] = (mtime, size, tracks)
+        for tid in tracks:
+            self._track_files.setdefault(tid, set()).add(path)
+
+    def _unindex_file(self, path):
+        old = self._scan_cache.pop(path, None)
+        if old is None: return
+        for tid in old[2]:
+            paths = self._track_files.get(tid)
+            if paths is not None:
+                paths.discard(path)
+                if not paths: del self._track_files[tid]
+
+    def _json_entries(self, json_folder):
+        """Lists the per-frame JSON files of a folder as DirEntry objects (snapshot, safe to write while iterating)."""
+        with os.scandir(json_folder) as it:
+            return [entry for entry in it
+                    if entry.name.endswith(".json") and not entry.name.startswith("classes") and entry.is_file()]
+
+    def _refresh_index(self, json_folder):
+        """
+        Brings the scan cache up to date with the folder and returns the readable JSON paths in directory order.
+        Files whose mtime and size are unchanged since the last refresh are not re-parsed;
+        the remaining ones are parsed in parallel.
+        """
+        with self._cache_lock:
+            # The index describes one folder: start over when another one is opened
+            # (the parsed contents too, or every folder of the session would stay in memory)
+            if json_folder != self._indexed_folder:
+                self._scan_cache = {}
+                self._track_files = {}
+                self._parsed_cache = {}
+                self._indexed_folder = json_folder
+
+            # 1. List the files with their stat info
+            files = []
+            for entry in self._json_entries(json_folder):
+                try:
+                    st = entry.stat()
+                except OSError: continue
+                files.append((entry.path, st.st_mtime_ns, st.st_size))
+
+            # 2. Parse new or changed files across a thread pool
+            stale = []
+            for path, mtime, size in files:
+                cached = self._scan_cache.get(path)
+                if not cached or cached[0] != mtime or cached[1] != size:
+                    stale.append(path)
+
+            parsed = {}
+            if stale:
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    parsed = dict(zip(stale, ex.map(self._parse_one_json, stale)))
+
+            # 3. Update the caches; unreadable files are left out
+            paths = []
+            for path, mtime, size in files:
+                if path in parsed:
+                    if parsed[path] is None:
+                        self._unindex_file(path)
+                        self._parsed_cache.pop(path, None)
+                        continue
+                    data, tracks = parsed[path]
+                    self._parsed_cache[path] = ((mtime, size), data)
+                    self._index_file(path, mtime, size, tracks)
+                paths.append(path)
+
+            # Files deleted since the last refresh must not keep their tracks alive
+            listed = set(paths)
+            for path in [p for p in self._scan_cache if p not in listed]:
+                self._unindex_file(path)
+            return paths
 
-
-    def rebuild_track_cache(self, json_folder):
+    def scan_folder(self, json_folder):
         """
-        Clears and rebuilds the folder_unique_tracks map by scanning all JSON files.
-        This ensures that if a Track ID is removed from the last frame it existed in,
-        it disappears from the sidebar immediately.
+        Scans all JSON files to build a list of all existing objects (positive track ids only).
         """
-        self.folder_unique_tracks = {}
+        with self._cache_lock:
+            self.folder_unique_tracks = {}
+            self.next_suggestion_track_id = 1
         
-        if not os.path.exists(json_folder): return
+            if not os.path.exists(json_folder): return
 
-        for filename in os.listdir(json_folder):
-            if not filename.endswith(".json") or filename.startswith("classes"): 
-                continue
-            
-            path = os.path.join(json_folder, filename)
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                
-                for val in data.values():
-                    tid = val.get('track_id')
-                    cls = val.get('class')
-                    # We just need to know it exists. 
-                    # If multiple frames have different classes for ID X (rare error), last one wins.
-                    self.folder_unique_tracks[tid] = cls
-            except: pass
+            # Merge per-file contributions (serially, in directory order)
+            for path in self._refresh_index(json_folder):
+                for tid, cls in self._scan_cache[path][2].items():
+                    if isinstance(tid, int) and tid > 0 and cls is not None:
+                        self.folder_unique_tracks[tid] = cls
 
-    def scan_folder(self, json_folder):
-        """Scans all JSON files to build a list of all existing objects."""
-        self.folder_unique_tracks = {}
-        self.next_suggestion_track_id = 1
-        
-        if not os.path.exists(json_folder): return
+            self.next_suggestion_track_id = max(self.folder_unique_tracks, default=0) + 1
 
-        for filename in os.listdir(json_folder):
-            if filename.endswith(".json") and not filename.startswith("classes"):
-                try:
-                    with open(os.path.join(json_folder, filename), 'r') as f:
-                        data = json.load(f)
-                        for entry in data.values():
-                            if 'track_id' in entry and 'class' in entry:
-                                tid = entry['track_id']
-                                cid = entry['class']
-                                if tid > 0:
-                                    self.folder_unique_tracks[tid] = cid
-                                    if tid >= self.next_suggestion_track_id:
-                                        self.next_suggestion_track_id = tid + 1
-                except: continue
+    def _file_may_have_track(self, entry, *track_ids):
+        """
+        Uses the scan cache to rule out files without parsing them.
+        Returns False only if the file is unchanged since it was indexed and contains none of track_ids.
+        """
+        cached = self._scan_cache.get(entry.path)
+        if not cached:
+            return True
+        st = entry.stat()
+        if cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            return True
+        return any(tid in cached[2] for tid in track_ids)
 
     def load_from_file(self, filepath):
         self.boxes = {}
         self.current_json_path = filepath
         self.next_id = 0 
         
-        if not os.path.exists(filepath):
+        try:
+            st = os.stat(filepath)
+        except OSError:
             return
 
+        # Revisiting an unchanged file: reuse its parsed contents instead of reading the JSON again
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                
-            for key, entry in data.items():
-                if 'box' not in entry: continue
-                box_id = int(key)
-                self.boxes[box_id] = entry
-                if box_id >= self.next_id: self.next_id = box_id + 1
-                
+            data = self._read_parsed(filepath, st)
         except json.JSONDecodeError:
             print(f"Error reading JSON: {filepath}")
+            return
+
+        # Copies: self.boxes is edited in place, the cached entries must stay as on disk
+        for key, entry in data.items():
+            if 'box' not in entry: continue
+            box_id = int(key)
+            self.boxes[box_id] = copy_box_entry(entry)
+            if box_id >= self.next_id: self.next_id = box_id + 1
 
     def save_to_file(self):
         if not self.current_json_path: return
-        save_data = {bid: data for bid, data in self.boxes.items() if data.get('class', -1) != -1}
-        with open(self.current_json_path, 'w') as f:
-            json.dump(save_data, f, indent=4)
+        save_data = {str(bid): data for bid, data in self.boxes.items() if data.get('class', -1) != -1}
+
+        # Nothing to write if the file still holds exactly this content
+        cached = self._parsed_cache.get(self.current_json_path)
+        if cached is not None and cached[1] == save_data:
+            try:
+                st = os.stat(self.current_json_path)
+                if cached[0] == (st.st_mtime_ns, st.st_size): return
+            except OSError: pass
+
+        write_json(self.current_json_path, save_data)
+        # Write-through: the next load or scan of this frame needs no parse
+        self._store_written(self.current_json_path,
+                            {bid: copy_box_entry(data) for bid, data in save_data.items()})
             
     def add_box(self, rect, class_id, track_id):
         box_id = self.next_id
@@ -196,27 +495,40 @@ class AnnotationManager:
         if box_id in self.boxes and rect:
             self.boxes[box_id]['box'] = [rect.left(), rect.top(), rect.right(), rect.bottom()]
 
+    def box_arrays(self):
+        """
+        Returns the current frame's boxes as contiguous arrays for bulk/vectorized work:
+        (box_ids int32 (N,), coords float64 (N,4), classes int32 (N,), track_ids int32 (N,)).
+        Missing class/track ids are -1. Coordinates keep full precision, so overlap
+        thresholds decide exactly as on the lists.
+        self.boxes stays the source of truth; the arrays are built from it in one pass.
+        """
+        n = len(self.boxes)
+        ids = np.empty(n, dtype=np.int32)
+        coords = np.empty((n, 4), dtype=np.float64)
+        classes = np.empty(n, dtype=np.int32)
+        tracks = np.empty(n, dtype=np.int32)
+        for row, (bid, data) in enumerate(self.boxes.items()):
+            ids[row] = bid
+            coords[row] = data['box']
+            cid = data.get('class')
+            classes[row] = -1 if cid is None else cid
+            tid = data.get('track_id')
+            tracks[row] = -1 if tid is None else tid
+        return ids, coords, classes, tracks
+
     def check_track_used_globally(self, track_id, json_folder):
         """
-        Scans all JSON files to see if track_id exists ANYWHERE.
-        Returns True immediately if found, False if scanned all and not found.
+        Checks the folder index to see if track_id exists ANYWHERE.
+        The index is re-validated first: every file is stat-checked and only the
+        ones changed outside the manager are parsed again.
         """
-        if not os.path.exists(json_folder): return False
+        with self._cache_lock:
+            if not os.path.exists(json_folder): return False
         
-        for filename in os.listdir(json_folder):
-            if not filename.endswith(".json") or filename.startswith("classes"): 
-                continue
-            
-            path = os.path.join(json_folder, filename)
-            try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
-                    for entry in data.values():
-                        if entry.get('track_id') == track_id:
-                            return True # Found it! Track is still alive.
-            except: pass
-            
-        return False # Track is completely gone.
+            self._refresh_index(json_folder)
+            # Found it -> Track is still alive; otherwise it is completely gone.
+            return track_id in self._track_files
     
     def delete_box(self, box_id):
         """
@@ -229,110 +541,152 @@ class AnnotationManager:
         return None
 
         
-    def interpolate_track(self, target_track_id, json_folder, image_files):
+    def interpolate_track(self, target_track_id, json_folder, image_files, json_names=None):
         """
         Locates all instances of target_track_id across all files.
         Linearly interpolates boxes between existing keyframes.
+        json_names: optional JSON file name per image (same order), reused across calls.
+        """
+        return self.interpolate_tracks([target_track_id], json_folder, image_files, json_names)[1]
+
+    def interpolate_tracks(self, track_ids, json_folder, image_files, json_names=None,
+                           should_stop=None, progress=None):
+        """
+        Interpolates several tracks in one pass: every track's new boxes are computed first,
+        then each target file is read and written once for all of them (not once per track).
+        should_stop() is polled between tracks; progress(n) reports the tracks computed so far.
+        Returns (tracks processed, boxes added).
+        """
+        # One directory read instead of an os.path.exists() call per frame
+        existing_files = {}
+        if os.path.exists(json_folder):
+            with os.scandir(json_folder) as it:
+                existing_files = {entry.name: entry for entry in it}
+        
+        # Expected JSON name/path for every image, built once (same order as image_files)
+        if json_names is None:
+            json_names = json_names_for(image_files)
+        json_paths = [os.path.join(json_folder, json_filename) for json_filename in json_names]
+
+        # New boxes grouped by target frame, then by track: { target_idx: { track_id: [box, ...] } }
+        pending = defaultdict(dict)
+        processed = 0
+        for track_id in track_ids:
+            if should_stop is not None and should_stop():
+                break
+            for target_idx, new_entries in self._plan_interpolation(
+                    track_id, existing_files, json_names, json_paths).items():
+                pending[target_idx][track_id] = new_entries
+            processed += 1
+            if progress is not None:
+                progress(processed)
+
+        count = 0
+        # Write each target file once, tracks in the order they were requested
+        for target_idx in sorted(pending):
+            target_path = json_paths[target_idx]
+            file_data = {}
+            if json_names[target_idx] in existing_files:
+                # Shallow copy of the cached contents: new keys are added, existing entries untouched
+                try:
+                    file_data = dict(self._read_parsed(target_path, existing_files[json_names[target_idx]].stat()))
+                except (OSError, ValueError, TypeError):
+                    # Corrupt or vanished since the scan: leave it alone rather than overwrite it
+                    print(f"Error reading JSON: {target_path}")
+                    continue
+
+            # Safety Check: Don't overwrite if track already exists there
+            present = file_tracks(file_data)
+            
+            # Add new boxes: next free id computed once per file, then incremented
+            new_bid = max((int(k) for k in file_data if k.isdigit()), default=-1) + 1
+            added = 0
+            for track_id, new_entries in pending[target_idx].items():
+                if track_id in present: continue
+                for entry in new_entries:
+                    file_data[str(new_bid)] = entry
+                    new_bid += 1
+                    added += 1
+            if not added: continue
+
+            write_json(target_path, file_data)
+            # The frame reload (and later edits) reuse it without a parse
+            self._store_written(target_path, file_data)
+            count += added
+
+        return processed, count
+
+    def _plan_interpolation(self, target_track_id, existing_files, json_names, json_paths):
+        """
+        Reads the keyframes of one track and returns the boxes filling its gaps,
+        grouped by target frame: { target_idx: [entry, ...] }. Writes nothing.
         """
         # 1. Gather all existing keyframes for this track
         # keyframes = { frame_index: { 'box': [x1,y1,x2,y2], 'class': class_id } }
         keyframes = {}
         
-        # Iterate through the correctly sorted image files list
-        for idx, image_filename in enumerate(image_files):
-            # Construct expected JSON path for this image
-            json_filename = os.path.splitext(image_filename)[0] + ".json"
-            json_path = os.path.join(json_folder, json_filename)
-            
-            if os.path.exists(json_path):
+        # Byte patterns for this track id, as written by indented and compact JSON
+        needles = (f'"track_id": {target_track_id}'.encode(), f'"track_id":{target_track_id}'.encode())
+        
+        # Frames whose file may hold the track (the scan cache rules out most unchanged files)
+        candidates = []
+        for idx, json_filename in enumerate(json_names):
+            if json_filename in existing_files:
                 try:
-                    with open(json_path, 'r') as f:
-                        data = json.load(f)
-                        # Check if our target track is in this file
-                        for entry in data.values():
-                            if entry.get('track_id') == target_track_id:
-                                keyframes[idx] = {
-                                    'box': entry['box'],
-                                    'class': entry['class']
-                                }
-                                break
-                except: pass
+                    if self._file_may_have_track(existing_files[json_filename], target_track_id):
+                        candidates.append(idx)
+                except OSError: pass
+
+        def read_keyframe(idx):
+            try:
+                with open(json_paths[idx], 'rb') as f:
+                    raw = f.read()
+                # Cheap substring test first: only parse files that can contain the track
+                # (a hit may be a longer id, e.g. 12 for 1; the loop below confirms)
+                if needles[0] not in raw and needles[1] not in raw:
+                    return None
+                data = parse_json(raw)
+                # Check if our target track is in this file
+                for entry in data.values():
+                    if entry.get('track_id') == target_track_id:
+                        return {
+                            'box': entry['box'],
+                            'class': entry['class']
+                        }
+            except: pass
+            return None
+
+        # Read the candidates in parallel (file reads and orjson release the GIL), keep frame order
+        if candidates:
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                for idx, keyframe in zip(candidates, ex.map(read_keyframe, candidates)):
+                    if keyframe is not None:
+                        keyframes[idx] = keyframe
 
         # 2. Sort keyframes by frame index (Logic from here is standard)
         sorted_indices = sorted(keyframes.keys())
         if len(sorted_indices) < 2:
-            return 0 # Not enough points to interpolate
+            return {} # Not enough points to interpolate
+
+        pending = defaultdict(list)
+
+        # 3. Interpolate all gaps (Frame A -> Frame B pairs) at once; adjacent frames yield nothing
+        segments, targets, interp_boxes = interpolate_keyframes(
+            sorted_indices, [keyframes[idx]['box'] for idx in sorted_indices])
+        # Whole-pixel coordinates keep the JSON compact (no 15-digit floats)
+        interp_boxes = np.rint(interp_boxes).astype(np.int64)
+
+        # 4. Fill the gaps, each box takes the class of its starting keyframe
+        classes = [keyframes[idx]['class'] for idx in sorted_indices]
+        for seg, target_idx, (nx1, ny1, nx2, ny2) in zip(segments.tolist(), targets.tolist(), interp_boxes.tolist()):
+            # Queue for the Target JSON
+            pending[target_idx].append({
+                'box': [nx1, ny1, nx2, ny2],
+                'class': classes[seg],
+                'track_id': target_track_id
+            })
+        return pending
 
-        count = 0
-        
-        # 3. Iterate through pairs (Frame A -> Frame B)
-        for i in range(len(sorted_indices) - 1):
-            start_idx = sorted_indices[i]
-            end_idx = sorted_indices[i+1]
-            
-            # If frames are adjacent, nothing to fill
-            steps = end_idx - start_idx
-            if steps <= 1: continue
-
-            start_data = keyframes[start_idx]
-            end_data = keyframes[end_idx]
-            
-            # Calculate step size per frame
-            sx1, sy1, sx2, sy2 = start_data['box']
-            ex1, ey1, ex2, ey2 = end_data['box']
-            
-            dx1 = (ex1 - sx1) / steps
-            dy1 = (ey1 - sy1) / steps
-            dx2 = (ex2 - sx2) / steps
-            dy2 = (ey2 - sy2) / steps
-            
-            # 4. Fill the gap
-            class_id = start_data['class']
-            
-            for step in range(1, steps):
-                target_idx = start_idx + step
-                
-                # Calculate new coords
-                nx1 = sx1 + (dx1 * step)
-                ny1 = sy1 + (dy1 * step)
-                nx2 = sx2 + (dx2 * step)
-                ny2 = sy2 + (dy2 * step)
-                
-                # Load Target JSON
-                target_filename = image_files[target_idx]
-                target_path = os.path.join(json_folder, os.path.splitext(target_filename)[0] + ".json")
-                
-                file_data = {}
-                if os.path.exists(target_path):
-                    with open(target_path, 'r') as f:
-                        file_data = json.load(f)
-                
-                # Safety Check: Don't overwrite if track already exists there
-                exists = False
-                for v in file_data.values():
-                    if v.get('track_id') == target_track_id:
-                        exists = True
-                        break
-                if exists: continue
-
-                # Add new box
-                new_bid = 0
-                if file_data:
-                    try:
-                        new_bid = max([int(k) for k in file_data.keys()]) + 1
-                    except: new_bid = 0
-                
-                file_data[str(new_bid)] = {
-                    'box': [nx1, ny1, nx2, ny2],
-                    'class': class_id,
-                    'track_id': target_track_id
-                }
-                
-                with open(target_path, 'w') as f:
-                    json.dump(file_data, f, indent=4)
-                count += 1
-                
-        return count
     def update_track_id_globally(self, old_tid, new_tid, json_folder):
         """
         Renames a Track ID in ALL JSON files in the folder.
@@ -341,15 +695,16 @@ class AnnotationManager:
         
         count = 0
         # Scan all files
-        for filename in os.listdir(json_folder):
-            if not filename.endswith(".json") or filename.startswith("classes"): 
+        for entry in self._json_entries(json_folder):
+            # The folder index proves most files don't contain the track: skip their parse
+            if not self._file_may_have_track(entry, old_tid):
                 continue
             
-            path = os.path.join(json_folder, filename)
+            path = entry.path
             changed = False
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                # Cached contents (re-read only if the file changed), edited in place
+                data = self._read_parsed(path, entry.stat())
                 
                 # Check and Modify
                 for key, val in data.items():
@@ -360,9 +715,11 @@ class AnnotationManager:
                 
                 # Save back if changed
                 if changed:
-                    with open(path, 'w') as f:
-                        json.dump(data, f, indent=4)
-            except: pass
+                    write_json(path, data)
+                    self._store_written(path, data)
+            except:
+                # Never keep in-place edits that did not reach the disk
+                self._parsed_cache.pop(path, None)
             
         return count
 
@@ -371,26 +728,31 @@ class AnnotationManager:
         Changes the Class ID for a specific Track ID in ALL JSON files.
         """
         count = 0
-        for filename in os.listdir(json_folder):
-            if not filename.endswith(".json") or filename.startswith("classes"): 
+        for entry in self._json_entries(json_folder):
+            # The folder index proves most files don't contain the track: skip their parse
+            if not self._file_may_have_track(entry, track_id):
                 continue
             
-            path = os.path.join(json_folder, filename)
+            path = entry.path
             changed = False
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                # Cached contents (re-read only if the file changed), edited in place
+                data = self._read_parsed(path, entry.stat())
                 
                 for key, val in data.items():
                     if val.get('track_id') == track_id:
-                        val['class'] = new_class
-                        changed = True
+                        # Files already carrying new_class are counted but not rewritten
+                        if val.get('class') != new_class:
+                            val['class'] = new_class
+                            changed = True
                         count += 1
                 
                 if changed:
-                    with open(path, 'w') as f:
-                        json.dump(data, f, indent=4)
-            except: pass
+                    write_json(path, data)
+                    self._store_written(path, data)
+            except:
+                # Never keep in-place edits that did not reach the disk
+                self._parsed_cache.pop(path, None)
         return count
 
     def swap_track_id_globally(self, id1, id2, json_folder):
@@ -401,15 +763,16 @@ class AnnotationManager:
         if id1 == id2: return 0
         
         count = 0
-        for filename in os.listdir(json_folder):
-            if not filename.endswith(".json") or filename.startswith("classes"): 
+        for entry in self._json_entries(json_folder):
+            # The folder index proves most files don't contain the track: skip their parse
+            if not self._file_may_have_track(entry, id1, id2):
                 continue
             
-            path = os.path.join(json_folder, filename)
+            path = entry.path
             changed = False
             try:
-                with open(path, 'r') as f:
-                    data = json.load(f)
+                # Cached contents (re-read only if the file changed), edited in place
+                data = self._read_parsed(path, entry.stat())
                 
                 for key, val in data.items():
                     current_id = val.get('track_id')
@@ -425,9 +788,11 @@ class AnnotationManager:
                         count += 1
                 
                 if changed:
-                    with open(path, 'w') as f:
-                        json.dump(data, f, indent=4)
-            except: pass
+                    write_json(path, data)
+                    self._store_written(path, data)
+            except:
+                # Never keep in-place edits that did not reach the disk
+                self._parsed_cache.pop(path, None)
             
         return count
 
@@ -435,7 +800,68 @@ class AnnotationManager:
 # 3. VISUAL ITEMS
 # =============================================================================
 
+def _build_handle_table():
+    """
+    Maps a 4-bit edge mask (top, bottom, left, right) to (cursor, resize handle).
+    Corners win over edges, so small boxes where opposite edges overlap resolve the same way as before.
+    """
+    table = []
+    for mask in range(16):
+        on_top, on_bottom, on_left, on_right = bool(mask & 8), bool(mask & 4), bool(mask & 2), bool(mask & 1)
+        if on_top and on_left: entry = (qtg.Qt.SizeFDiagCursor, "TL")
+        elif on_top and on_right: entry = (qtg.Qt.SizeBDiagCursor, "TR")
+        elif on_bottom and on_left: entry = (qtg.Qt.SizeBDiagCursor, "BL")
+        elif on_bottom and on_right: entry = (qtg.Qt.SizeFDiagCursor, "BR")
+        elif on_left: entry = (qtg.Qt.SizeHorCursor, "L")
+        elif on_right: entry = (qtg.Qt.SizeHorCursor, "R")
+        elif on_top: entry = (qtg.Qt.SizeVerCursor, "T")
+        elif on_bottom: entry = (qtg.Qt.SizeVerCursor, "B")
+        else: entry = (qtg.Qt.ArrowCursor, None)
+        table.append(entry)
+    return tuple(table)
+
+_HANDLE_TABLE = _build_handle_table()
+
+class OutlinedTextItem(qtw.QGraphicsPathItem):
+    """Box label drawn as a text path: white fill, black outline, optional colored backdrop."""
+    def __init__(self, text, font, parent=None):
+        super().__init__(parent)
+        self.text_font = font
+        self.background = None
+        self.setPen(qtg.QPen(qtg.Qt.black, 2))
+        self.setBrush(qtg.QBrush(qtg.Qt.white))
+        self.set_text(text)
+
+    def set_text(self, text):
+        path = qtg.QPainterPath()
+        # addText() places the baseline at y, so shift by the ascent to keep the top-left at (0, 0)
+        path.addText(2, qtg.QFontMetricsF(self.text_font).ascent() + 2, self.text_font, text)
+        self.setPath(path)
+
+    def set_background(self, color):
+        """Sets the backdrop color (None for no backdrop)."""
+        self.prepareGeometryChange()
+        self.background = qtg.QColor(color) if color is not None else None
+
+    def boundingRect(self):
+        rect = super().boundingRect()
+        if self.background is not None:
+            rect = rect.united(self.path().boundingRect().adjusted(-2, -2, 2, 2))
+        return rect
+
+    def paint(self, painter, option, widget=None):
+        if self.background is not None:
+            painter.fillRect(self.path().boundingRect().adjusted(-2, -2, 2, 2), self.background)
+        # Glyph outlines are the only curves on the scene: antialias just them
+        painter.save()
+        painter.setRenderHint(qtg.QPainter.Antialiasing, True)
+        super().paint(painter, option, widget)
+        painter.restore()
+
 class BoxItem(qtw.QGraphicsRectItem):
+    # Label font shared by all boxes (created on first use, once a QApplication exists)
+    label_font = None
+
     def __init__(self, rect, box_id, track_id, manager, main_window):
         super().__init__(rect)
         self.box_id = box_id
@@ -453,25 +879,33 @@ class BoxItem(qtw.QGraphicsRectItem):
         self.setAcceptHoverEvents(True)
         
         # Text Label Setup
-        self.text = qtw.QGraphicsTextItem(str(track_id), self)
-        self.text.setDefaultTextColor(qtg.Qt.white)
-        
         # CHANGED: Font size increased from 10 to 14
-        self.text.setFont(qtg.QFont("Arial", 14, qtg.QFont.Bold))
+        if BoxItem.label_font is None:
+            BoxItem.label_font = qtg.QFont("Arial", 14, qtg.QFont.Bold)
         
-        # OPTIONAL: Add a black shadow/outline effect to text so it's readable on bright backgrounds
-        # This makes the text "pop" regardless of the box color
-        shadow = qtw.QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(3)
-        shadow.setColor(qtg.Qt.black)
-        shadow.setOffset(1, 1)
-        self.text.setGraphicsEffect(shadow)
+        # White text with a black outline so it's readable on bright backgrounds.
+        # (Replaces a QGraphicsDropShadowEffect, which re-rendered every label offscreen on each repaint)
+        self.text = OutlinedTextItem(str(track_id), BoxItem.label_font, self)
 
         self.update_label_pos()
         
         self.resizing = False
         self.resize_handle = None
 
+    def retarget(self, rect, track_id):
+        """Reuses this item for the box with the same id on another frame (no new graphics items)."""
+        self.setSelected(False)
+        # Forget the last hover: without a fresh hover move a press must start a move, as on a new item
+        self.resizing = False
+        self.resize_handle = None
+        self.unsetCursor()
+        self.setPos(0, 0)
+        self.setRect(rect)
+        self.set_color(track_id)
+        self.text.set_text(str(track_id))
+        self.text.set_background(None)
+        self.update_label_pos()
+
     def update_appearance(self, class_id, track_id):
         # 1. Update Internal IDs
         self.class_id = class_id
@@ -495,24 +929,16 @@ class BoxItem(qtw.QGraphicsRectItem):
 
         # 4. Update Text (Safe)
         if hasattr(self, 'text'):
-            self.text.setPlainText(f"{track_id} : {cls_name}")
+            self.text.set_text(f"{track_id} : {cls_name}")
             
-            # Optional: Add background color to text for readability
-            # We need to find the color again safely
-            try:
-                # Assuming get_color_for_id is global or we can grab pen color
-                color = self.pen().color() 
-                self.text.setHtml(f'<div style="background-color: {color.name()}; color: white; padding: 2px;">{track_id} : {cls_name}</div>')
-            except:
-                pass
+            # Add background color to text for readability (same color as the box)
+            self.text.set_background(self.pen().color())
 
     def set_color(self, track_id):
-        color = get_color_for_id(track_id)
-        
-        # CHANGED: Pen width increased from 2 to 4
-        self.setPen(qtg.QPen(color, 7))
+        # CHANGED: Pen width increased from 2 to 7
+        self.setPen(get_pen_for_id(track_id))
         
-        self.setBrush(qtg.QBrush(qtg.Qt.transparent))
+        self.setBrush(_TRANSPARENT_BRUSH)
 
     def update_label_pos(self):
         # Keep text inside top-left corner
@@ -536,35 +962,11 @@ class BoxItem(qtw.QGraphicsRectItem):
         on_top = abs(pos.y() - top) < margin
         on_bottom = abs(pos.y() - bottom) < margin
 
-        # Determine cursor and handle
-        if on_top and on_left:
-            self.setCursor(qtg.Qt.SizeFDiagCursor)
-            self.resize_handle = "TL"
-        elif on_top and on_right:
-            self.setCursor(qtg.Qt.SizeBDiagCursor)
-            self.resize_handle = "TR"
-        elif on_bottom and on_left:
-            self.setCursor(qtg.Qt.SizeBDiagCursor)
-            self.resize_handle = "BL"
-        elif on_bottom and on_right:
-            self.setCursor(qtg.Qt.SizeFDiagCursor)
-            self.resize_handle = "BR"
-        elif on_left:
-            self.setCursor(qtg.Qt.SizeHorCursor)
-            self.resize_handle = "L"
-        elif on_right:
-            self.setCursor(qtg.Qt.SizeHorCursor)
-            self.resize_handle = "R"
-        elif on_top:
-            self.setCursor(qtg.Qt.SizeVerCursor)
-            self.resize_handle = "T"
-        elif on_bottom:
-            self.setCursor(qtg.Qt.SizeVerCursor)
-            self.resize_handle = "B"
-        else:
-            self.setCursor(qtg.Qt.ArrowCursor)
-            self.resize_handle = None
-            
+        # Determine cursor and handle: one table lookup on a 4-bit edge mask
+        mask = (on_top << 3) | (on_bottom << 2) | (on_left << 1) | on_right
+        cursor, self.resize_handle = _HANDLE_TABLE[mask]
+        self.setCursor(cursor)
+
         super().hoverMoveEvent(event)
 
     def mousePressEvent(self, event):
@@ -612,7 +1014,7 @@ class BoxItem(qtw.QGraphicsRectItem):
 
         # Save changes
         self.manager.update_box(self.box_id, rect=self.rect())
-        self.main_window.save_data()
+        self.main_window.schedule_save()
         self.main_window.sync_selection_from_scene(self.box_id)
         
         super().mouseReleaseEvent(event)
@@ -678,8 +1080,7 @@ class YoloWorker(qtc.QThread):
             return
 
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            config = read_json(self.config_path)
         except: return
 
         model_name = config.get("model_path", "yolov11n.pt")
@@ -698,30 +1099,41 @@ class YoloWorker(qtc.QThread):
             # If running in Dev (or file missing), let Ultralytics download/cache it
             load_path = model_name
 
+        # Default device='cpu' to prevent Quadro P5000 crash; "device" in the config opts into a GPU (e.g. 0)
+        device = config.get("device", "cpu")
+        # FP16 on the GPU: half the memory traffic, no visible change in the boxes
+        half = device != "cpu" and config.get("half", True)
         try:
-            model = YOLO(load_path)
+            model = get_yolo_model(load_path, device, half)
         except Exception as e:
             print(f"Error loading model: {e}")
             return
 
         # 3. Run Inference
-        # Force device='cpu' to prevent Quadro P5000 crash
         # verbose=False keeps the console clean
+        options = {'half': True} if half else {}
         try:
-            results = model.predict(self.image_path, conf=conf, device='cpu', verbose=False)
+            results = model.predict(self.image_path, conf=conf, device=device, verbose=False, **options)
         except Exception as e:
-            print(f"Inference Error: {e}")
-            return
+            if device == "cpu":
+                print(f"Inference Error: {e}")
+                return
+            print(f"Inference Error on device {device}, retrying on CPU: {e}")
+            # The failed model's predictor stays bound to that device: retry with the CPU model
+            drop_yolo_model(load_path, device, half)
+            try:
+                results = get_yolo_model(load_path).predict(self.image_path, conf=conf, device='cpu', verbose=False)
+            except Exception as e:
+                print(f"Inference Error: {e}")
+                return
 
         detected_objects = []
 
         # 4. Process Results
         for result in results:
-            boxes = result.boxes
-            for box in boxes:
-                # YOLO coordinates
-                x1, y1, x2, y2 = box.xyxy[0].tolist()
-                cls_id = int(box.cls[0].item())
+            # One tensor -> list conversion per image instead of one per box
+            for (x1, y1, x2, y2), cls_id in zip(result.boxes.xyxy.tolist(), result.boxes.cls.tolist()):
+                cls_id = int(cls_id)
                 
                 # Check Mapping
                 # We cast cls_id to str because JSON keys are always strings
@@ -735,10 +1147,72 @@ class YoloWorker(qtc.QThread):
 
         self.results_ready.emit(detected_objects)
 
+class InterpolateWorker(qtc.QThread):
+    """
+    Runs track interpolation in a separate thread: it rewrites JSON files across the whole folder.
+    Only touches files, never Qt objects; stops between tracks when interruption is requested.
+    """
+    progress = qtc.Signal(int) # Number of tracks finished so far
+    results_ready = qtc.Signal(int, int) # (tracks processed, boxes added)
+    failed = qtc.Signal(str) # Error message; results_ready is not emitted then
+
+    def __init__(self, manager, track_ids, json_folder, frame_files, json_names):
+        super().__init__()
+        self.manager = manager
+        self.track_ids = list(track_ids)
+        self.json_folder = json_folder
+        self.frame_files = list(frame_files)
+        self.json_names = list(json_names)
+
+    def run(self):
+        # Every frame file is written once for all tracks, after they have all been computed
+        try:
+            tracks_processed, total_added = self.manager.interpolate_tracks(
+                self.track_ids, self.json_folder, self.frame_files, self.json_names,
+                should_stop=self.isInterruptionRequested, progress=self.progress.emit)
+        except Exception as e:
+            print(f"Interpolation Error: {e}")
+            self.failed.emit(str(e))
+            return
+        self.results_ready.emit(tracks_processed, total_added)
+
+def read_frame_image(path, max_size=None):
+    """
+    Decodes a frame, letting the JPEG decoder downscale it to fit max_size.
+    Returns (image, full_size): full_size is the native resolution the boxes refer to.
+    """
+    reader = qtg.QImageReader(path)
+    full_size = reader.size()
+    if max_size is not None and full_size.isValid() and \
+            (full_size.width() > max_size.width() or full_size.height() > max_size.height()):
+        reader.setScaledSize(full_size.scaled(max_size, qtc.Qt.KeepAspectRatio))
+    img = reader.read()
+    if not full_size.isValid(): full_size = img.size()
+    return img, full_size
+
+class FrameLoaderSignals(qtc.QObject):
+    loaded = qtc.Signal(str, qtg.QImage, qtc.QSize) # (image path, decoded image, native size)
+
+class FrameLoader(qtc.QRunnable):
+    """
+    Decodes one frame image in a QThreadPool worker.
+    Uses QImage (safe outside the GUI thread, unlike QPixmap).
+    """
+    def __init__(self, path, max_size, signals):
+        super().__init__()
+        self.path = path
+        self.max_size = max_size
+        self.signals = signals
+
+    def run(self):
+        img, full_size = read_frame_image(self.path, self.max_size)
+        self.signals.loaded.emit(self.path, img, full_size)
+
 class ZoomableView(qtw.QGraphicsView):
     def __init__(self, scene):
         super().__init__(scene)
-        self.setRenderHint(qtg.QPainter.Antialiasing)
+        # No view-wide Antialiasing: the frame pixmap and the axis-aligned boxes gain nothing from it
+        # (labels enable it in their own paint)
         self.setRenderHint(qtg.QPainter.SmoothPixmapTransform)
         self.setTransformationAnchor(qtw.QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(qtw.QGraphicsView.AnchorUnderMouse)
@@ -746,6 +1220,9 @@ class ZoomableView(qtw.QGraphicsView):
         # Default: No dragging (Left click is for Drawing/Selecting)
         self.setDragMode(qtw.QGraphicsView.NoDrag)
 
+    zoomed = qtc.Signal()
+    resized = qtc.Signal()
+
     def wheelEvent(self, event):
         # --- ZOOM (Direct Scroll) ---
         zoom_in_factor = 1.15
@@ -755,10 +1232,15 @@ class ZoomableView(qtw.QGraphicsView):
             self.scale(zoom_in_factor, zoom_in_factor)
         else:
             self.scale(zoom_out_factor, zoom_out_factor)
+        self.zoomed.emit()
         
         # Accept the event so it doesn't try to scroll the scrollbars vertically
         event.accept()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
     def mousePressEvent(self, event):
         # PAN: Right Mouse Button
         if event.button() == qtc.Qt.RightButton:
@@ -809,15 +1291,55 @@ class MainWindow(qtw.QMainWindow):
         self.json_folder = ""
         self.current_frame_idx = -1
         self.frame_files = []
+        self.interp_thread = None # Running InterpolateWorker, if any
+        self.json_names = [] # JSON file name per frame, same order as frame_files
 
         self.is_drawing_mode = False
         self.pending_draw_data = None
         self.classes_map = {} # {name: id}
         self.id_to_name_map = {} # {id: name}
+        self.class_items = [] # "id: name" choices for the class dialogs, sorted by id
+        self.class_item_index = {} # {id: position in class_items}
         
         self.preset_track_id = None
         self.preset_class_id = None
 
+        # BoxItems currently on the scene: {box_id: BoxItem}
+        self.box_items = {}
+        # BoxItems taken off the scene by frame changes, reused for the next new box ids
+        self.box_item_pool = []
+        # Rows last shown in each object list: {QListWidget: tuple}, to skip identical rebuilds
+        self.list_snapshots = {}
+        # Copy of the folder tracks the folder list was last built from
+        self.folder_tracks_shown = None
+        # Frame list rows by box id: {box_id: QListWidgetItem}
+        self.list_items_by_bid = {}
+
+        # Decoded frames around the current one: {image_path: (QImage, native QSize)}, least recently used first
+        self.frame_cache = OrderedDict()
+        self.frame_cache_size = 8
+        self.prefetch_radius = 2
+        self.frame_requests = {} # path -> frame index, decoded in the background
+        self.frame_loader_signals = FrameLoaderSignals()
+        self.frame_loader_signals.loaded.connect(self.on_frame_prefetched)
+        # Frames are decoded at viewport resolution; the current one is re-read at full size on zoom
+        self.frame_decode_size = None
+        # Native size of every frame shown so far: {image_path: QSize}
+        self.frame_sizes = {}
+        # Converted background pixmaps (see get_frame_pixmap); the default 10 MB holds ~1 HD frame
+        qtg.QPixmapCache.setCacheLimit(128 * 1024)
+        self.bg_full_res = False
+        # View state right after the last fitInView; while unchanged, refitting is a no-op
+        self.view_fit = None
+        self.resize_timer = qtc.QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self.on_view_resized)
+
+        # Debounced saving for box move/resize: bursts of edits collapse into one write
+        self.save_timer = qtc.QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.save_data)
+
         self.setup_ui()
         self.load_classes_config()
         
@@ -875,41 +1397,20 @@ class MainWindow(qtw.QMainWindow):
         self.lbl_status.setText("Mode: View")
         self.lbl_status.setStyleSheet("color: grey;")
 
-    def calculate_iou(self, boxA, boxB):
-        # box: [x1, y1, x2, y2]
-        # Determine the (x, y) coordinates of the intersection rectangle
-        xA = max(boxA[0], boxB[0])
-        yA = max(boxA[1], boxB[1])
-        xB = min(boxA[2], boxB[2])
-        yB = min(boxA[3], boxB[3])
-
-        # Compute the area of intersection rectangle
-        interArea = max(0, xB - xA) * max(0, yB - yA)
-
-        # Compute the area of both rectangles
-        boxAArea = (boxA[2] - boxA[0]) * (boxA[3] - boxA[1])
-        boxBArea = (boxB[2] - boxB[0]) * (boxB[3] - boxB[1])
-
-        # Compute the intersection over union
-        iou = interArea / float(boxAArea + boxBArea - interArea)
-        return iou
-
     def run_yolo_detection(self):
         if not self.frame_files: return
+        self.flush_pending_save()
         if self.current_frame_idx > 0:
             # 1. Calculate path to previous frame's JSON
-            prev_filename = self.frame_files[self.current_frame_idx - 1]
-            prev_json_path = os.path.join(self.json_folder, os.path.splitext(prev_filename)[0] + ".json")
+            prev_json_path = os.path.join(self.json_folder, self.json_names[self.current_frame_idx - 1])
             
-            # 2. Check if it exists and has content
+            # 2. Check if it exists and has content (a missing file just fails the read)
             has_prev_data = False
-            if os.path.exists(prev_json_path):
-                try:
-                    with open(prev_json_path, 'r') as f:
-                        data = json.load(f)
-                        if data: # If dict is not empty
-                            has_prev_data = True
-                except: pass
+            try:
+                data = self.manager.read_file(prev_json_path)
+                if data: # If dict is not empty
+                    has_prev_data = True
+            except: pass
             
             # 3. Show Warning if missing
             if not has_prev_data:
@@ -958,92 +1459,91 @@ class MainWindow(qtw.QMainWindow):
         # If the user already drew a "Bicycle" here, don't let YOLO add another one on top.
         
         # 1. Get all boxes currently on the screen
-        existing_boxes = list(self.manager.boxes.values()) # [{'box':..., 'class':...}, ...]
-        
-        unique_detections = []
-        
-        for det in detections:
-            is_duplicate = False
-            for existing in existing_boxes:
-                # Check Overlap
-                iou = self.calculate_iou(det['box'], existing['box'])
-                
-                # Check Class (Optional: You might want to block even if class is different if overlap is huge)
-                # For now, we only block if it's the SAME class or very high overlap
-                if iou > 0.5 and det['class'] == existing['class']:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_detections.append(det)
-        
-        # Update our list to only use the non-duplicate ones
-        detections = unique_detections
-
-        if not detections:
+        _, existing_coords, existing_classes, _ = self.manager.box_arrays()
+        
+        # 2. One overlap matrix for both filters: detections x (detections + existing boxes)
+        n = len(detections)
+        det_coords = np.array([det['box'] for det in detections], dtype=np.float64).reshape(-1, 4)
+        overlaps = iou_matrix(det_coords, np.vstack((det_coords, existing_coords))) > 0.5
+        
+        # Check Class (Optional: You might want to block even if class is different if overlap is huge)
+        # For now, we only block if it's the SAME class or very high overlap
+        same_class = (np.array([det['class'] for det in detections])[:, None]
+                      == existing_classes[None, :])
+        is_duplicate = (overlaps[:, n:] & same_class).any(axis=1)
+        
+        # Only the non-duplicate ones go on to NMS
+        alive = ~is_duplicate
+        if not alive.any():
             self.lbl_status.setText("YOLO: No NEW objects found (ignored duplicates).")
             return
 
 
         # --- STEP 1: FILTER INTERNAL OVERLAPS (NMS) ---
         # (Same as before: remove YOLO overlapping with other YOLO boxes)
-        indices_to_drop = set()
-        for i in range(len(detections)):
-            if i in indices_to_drop: continue
-            for j in range(i + 1, len(detections)):
-                if j in indices_to_drop: continue
-                iou = self.calculate_iou(detections[i]['box'], detections[j]['box'])
-                if iou > 0.5:
-                    indices_to_drop.add(j)
+        # Greedy sweep in YOLO's order (highest confidence first): each kept detection
+        # suppresses every later one overlapping it, one vector op per kept box
+        for i in range(n):
+            if alive[i]:
+                alive[i + 1:] &= ~overlaps[i, i + 1:n]
 
-        final_detections = [d for k, d in enumerate(detections) if k not in indices_to_drop]
+        final_detections = [d for d, keep in zip(detections, alive) if keep]
 
         # --- STEP 2: LOAD PREVIOUS FRAME (Smart Matching) ---
         prev_frame_boxes = [] 
         if self.current_frame_idx > 0:
-            prev_filename = self.frame_files[self.current_frame_idx - 1]
-            prev_json_path = os.path.join(self.json_folder, os.path.splitext(prev_filename)[0] + ".json")
-            if os.path.exists(prev_json_path):
-                try:
-                    with open(prev_json_path, 'r') as f:
-                        data = json.load(f)
-                        for v in data.values():
-                            if 'box' in v and 'track_id' in v:
-                                prev_frame_boxes.append(v)
-                except: pass
+            prev_json_path = os.path.join(self.json_folder, self.json_names[self.current_frame_idx - 1])
+            try:
+                data = self.manager.read_file(prev_json_path)
+                for v in data.values():
+                    if 'box' in v and 'track_id' in v:
+                        prev_frame_boxes.append(v)
+            except: pass
+
+        # Overlap of each kept detection with each previous-frame box
+        prev_ious = iou_matrix([d['box'] for d in final_detections], [p['box'] for p in prev_frame_boxes])
 
         count = 0
         
         # --- STEP 3: CREATE BOXES ---
-        for item in final_detections:
-            new_box = item['box']
-            new_class = item['class']
-            assigned_track_id = -1
+        # Batched like load_frame: one repaint for all detections instead of one per box
+        self.view.setUpdatesEnabled(False)
+        self.scene.blockSignals(True)
+        try:
+            for row, item in enumerate(final_detections):
+                new_box = item['box']
+                new_class = item['class']
+                assigned_track_id = -1
             
-            # Match Logic
-            best_iou = 0.0
-            best_match_id = -1
-            best_match_class = -1
+                # Match Logic
+                best_iou = 0.0
+                best_match_id = -1
+                best_match_class = -1
             
-            for prev in prev_frame_boxes:
-                iou = self.calculate_iou(new_box, prev['box'])
-                if iou > best_iou:
-                    best_iou = iou
-                    best_match_id = prev['track_id']
-                    best_match_class = prev['class']
+                # First previous box with the highest overlap (ties keep the earliest, as a scan would)
+                if prev_frame_boxes:
+                    best = int(prev_ious[row].argmax())
+                    if prev_ious[row, best] > best_iou:
+                        best_iou = float(prev_ious[row, best])
+                        best_match_id = prev_frame_boxes[best]['track_id']
+                        best_match_class = prev_frame_boxes[best]['class']
             
-            # Sticky Class Logic
-            if best_iou > 0.3:
-                assigned_track_id = best_match_id
-                new_class = best_match_class 
-            else:
-                assigned_track_id = self.manager.next_suggestion_track_id
-                self.manager.next_suggestion_track_id += 1
+                # Sticky Class Logic
+                if best_iou > 0.3:
+                    assigned_track_id = best_match_id
+                    new_class = best_match_class 
+                else:
+                    assigned_track_id = self.manager.next_suggestion_track_id
+                    self.manager.next_suggestion_track_id += 1
             
-            rect = qtc.QRectF(new_box[0], new_box[1], new_box[2]-new_box[0], new_box[3]-new_box[1])
-            box_id = self.manager.add_box(rect, new_class, assigned_track_id)
-            self.draw_box_on_scene(box_id, rect, new_class, assigned_track_id)
-            count += 1
+                rect = qtc.QRectF(new_box[0], new_box[1], new_box[2]-new_box[0], new_box[3]-new_box[1])
+                box_id = self.manager.add_box(rect, new_class, assigned_track_id)
+                self.draw_box_on_scene(box_id, rect, new_class, assigned_track_id)
+                count += 1
+        finally:
+            self.scene.blockSignals(False)
+            self.view.setUpdatesEnabled(True)
+        self.view.viewport().update()
             
         self.save_data()
         self.refresh_lists()
@@ -1053,6 +1553,7 @@ class MainWindow(qtw.QMainWindow):
         """
         Runs interpolation for EVERY track ID found in the current sequence.
         """
+        self.flush_pending_save()
         if not self.manager.folder_unique_tracks:
             qtw.QMessageBox.information(self, "Info", "No tracks found in this folder to interpolate.")
             return
@@ -1068,31 +1569,77 @@ class MainWindow(qtw.QMainWindow):
         
         if reply == qtw.QMessageBox.No: return
 
-        # 2. Loop and Execute
-        total_added = 0
-        tracks_processed = 0
-        
-        # Get all unique IDs
-        all_ids = list(self.manager.folder_unique_tracks.keys())
-        
-        # Optional: Show a progress dialog if you have many tracks
-        progress = qtw.QProgressDialog("Interpolating tracks...", "Cancel", 0, len(all_ids), self)
-        progress.setWindowModality(qtc.Qt.WindowModal)
-        
-        for i, track_id in enumerate(all_ids):
-            if progress.wasCanceled():
-                break
-            
-            # Call the existing manager logic
-            count = self.manager.interpolate_track(track_id, self.json_folder, self.frame_files)
-            total_added += count
-            tracks_processed += 1
-            progress.setValue(i + 1)
-        
+        # 2. Run in the background for all unique IDs
+        self.start_interpolation(self.manager.folder_unique_tracks.keys(), self.on_interpolation_all_finished)
+
+    def on_interpolation_all_finished(self, tracks_processed, total_added):
         # 3. Final Feedback
         self.load_frame() # Refresh current view
         qtw.QMessageBox.information(self, "Complete", f"Processed {tracks_processed} tracks.\nAdded {total_added} new boxes total.")
 
+    def start_interpolation(self, track_ids, on_finished):
+        """
+        Runs InterpolateWorker behind a modal progress dialog; on_finished(tracks, boxes) runs on completion.
+        The dialog stays up until the worker has written its last file, so the frames can't be edited meanwhile.
+        """
+        if self.interp_thread is not None: return # One run at a time
+        worker = InterpolateWorker(self.manager, track_ids, self.json_folder, self.frame_files, self.json_names)
+        self.interp_thread = worker
+        total = len(worker.track_ids)
+        self.btn_interp.setEnabled(False)
+        self.btn_interp_all.setEnabled(False)
+
+        progress = qtw.QProgressDialog("Interpolating tracks...", "Cancel", 0, total, self)
+        progress.setWindowModality(qtc.Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        # Reaching the maximum only ends the planning: the files are written afterwards
+        progress.setAutoReset(False)
+        progress.setAutoClose(False)
+        finished = False
+        outcome = None # Args of results_ready, or the error message of failed
+
+        def on_progress(value):
+            progress.setValue(value)
+            if value >= total:
+                progress.setLabelText("Writing files...")
+
+        def on_cancel():
+            # Cancel/Esc hide the dialog: keep it up while the worker winds down
+            if finished: return
+            worker.requestInterruption()
+            progress.setLabelText("Cancelling...")
+            progress.show()
+
+        progress.canceled.connect(on_cancel)
+        progress.rejected.connect(on_cancel)
+        worker.progress.connect(on_progress)
+
+        def store_outcome(*args):
+            nonlocal outcome
+            outcome = args
+
+        def finish():
+            # Runs however the thread ended, so the dialog can't be left up with no worker behind it
+            nonlocal finished
+            finished = True
+            progress.close()
+            self.interp_thread = None
+            self.btn_interp.setEnabled(True)
+            self.btn_interp_all.setEnabled(True)
+            if outcome is not None and len(outcome) == 2:
+                on_finished(*outcome)
+                return
+            # Files written before the failure are kept: show them
+            self.load_frame()
+            error = outcome[0] if outcome else "The worker stopped unexpectedly."
+            qtw.QMessageBox.warning(self, "Interpolation Failed", f"Interpolation did not complete.\n{error}")
+
+        worker.results_ready.connect(store_outcome)
+        worker.failed.connect(store_outcome)
+        worker.finished.connect(finish)
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+
     def show_frame_list_menu(self, pos):
         """ Context menu for the top list (Current Frame Objects) """
         item = self.list_frame_objects.itemAt(pos)
@@ -1145,17 +1692,10 @@ class MainWindow(qtw.QMainWindow):
     def edit_class_single(self, box_id, box_data):
         current_cls = box_data['class']
         
-        # Prepare List
-        items = []
-        sorted_ids = sorted(self.id_to_name_map.keys())
-        current_index = 0
-        for i, cid in enumerate(sorted_ids):
-            name = self.id_to_name_map[cid]
-            items.append(f"{cid}: {name}")
-            if cid == current_cls:
-                current_index = i
+        # Prepare List (built once in load_classes_config)
+        current_index = self.class_item_index.get(current_cls, 0)
         
-        val_str, ok = qtw.QInputDialog.getItem(self, "Edit Class", "Select New Class:", items, current_index, False)
+        val_str, ok = qtw.QInputDialog.getItem(self, "Edit Class", "Select New Class:", self.class_items, current_index, False)
         
         if ok and val_str:
             new_class_id = int(val_str.split(':')[0])
@@ -1164,10 +1704,9 @@ class MainWindow(qtw.QMainWindow):
                 self.manager.boxes[box_id]['class'] = new_class_id
                 
                 # 2. Update Scene
-                for item in self.scene.items():
-                    if isinstance(item, BoxItem) and item.box_id == box_id:
-                        item.update_appearance(new_class_id, box_data['track_id'])
-                        break
+                item = self.box_items.get(box_id)
+                if item is not None:
+                    item.update_appearance(new_class_id, box_data['track_id'])
                 
                 # 3. FIX: Update Global Cache so bottom list updates
                 self.manager.folder_unique_tracks[box_data['track_id']] = new_class_id
@@ -1185,32 +1724,27 @@ class MainWindow(qtw.QMainWindow):
             self.manager.boxes[box_id]['track_id'] = val
             
             # 2. Update Scene
-            for item in self.scene.items():
-                if isinstance(item, BoxItem) and item.box_id == box_id:
-                    item.update_appearance(box_data['class'], val)
-                    break
+            item = self.box_items.get(box_id)
+            if item is not None:
+                item.update_appearance(box_data['class'], val)
             
             # 3. FIX: Add new Track ID to Global Cache
             self.manager.folder_unique_tracks[val] = box_data['class']
-            # (Optional: We don't delete the old ID from cache because it might exist in other frames)
 
         self.save_data()
-        self.manager.rebuild_track_cache(self.json_folder)
+        # Saving kept the folder index current: the old ID only leaves the list if no other frame has it
+        if ok and val != current_tid and not self.manager.check_track_used_globally(current_tid, self.json_folder):
+            self.manager.folder_unique_tracks.pop(current_tid, None)
         self.refresh_lists()
 
 
     # --- Global Edits (The Heavy Lifters) ---
     def edit_class_global(self, track_id):
-        # Prepare List
-        items = []
-        sorted_ids = sorted(self.id_to_name_map.keys())
-        for cid in sorted_ids:
-            name = self.id_to_name_map[cid]
-            items.append(f"{cid}: {name}")
-            
+        self.flush_pending_save()
+        # Prepare List (built once in load_classes_config)
         val_str, ok = qtw.QInputDialog.getItem(self, "Global Class Update", 
                                                f"Change Class for Track {track_id} in ALL frames to:", 
-                                               items, 0, False)
+                                               self.class_items, 0, False)
         
         if ok and val_str:
             new_class_id = int(val_str.split(':')[0])
@@ -1228,6 +1762,7 @@ class MainWindow(qtw.QMainWindow):
 
 
     def edit_track_global(self, old_track_id):
+        self.flush_pending_save()
         val, ok = qtw.QInputDialog.getInt(self, "Global Track Update", 
                                           f"Rename Track {old_track_id} in ALL frames to:", 
                                           old_track_id, -1, 10000)
@@ -1315,6 +1850,7 @@ class MainWindow(qtw.QMainWindow):
     #     self.set_view_mode()
 
     def swap_track_global(self, id1):
+        self.flush_pending_save()
         # 1. Ask for Target ID
         id2, ok = qtw.QInputDialog.getInt(self, "Swap Track ID (Global)", 
                                           f"Swap Track {id1} globally with:", 
@@ -1360,6 +1896,13 @@ class MainWindow(qtw.QMainWindow):
         # LEFT: Graphics View
         self.scene = AnnotationScene(self)
         self.view = ZoomableView(self.scene)
+
+        # Background frame: one persistent item, only its pixmap changes between frames
+        self.bg_item = self.scene.addPixmap(qtg.QPixmap())
+        self.bg_item.setZValue(-1)
+        self.bg_item.setTransformationMode(qtc.Qt.SmoothTransformation)
+        self.view.zoomed.connect(self.on_view_zoomed)
+        self.view.resized.connect(lambda: self.resize_timer.start(200))
         
         layout.addWidget(self.view, stretch=4)
         
@@ -1457,28 +2000,18 @@ class MainWindow(qtw.QMainWindow):
         return line
 
     def load_classes_config(self):
-        
-
-        # Use the helper to get the path
-        path = resource_path("id_list.txt")
-        
-        # The rest is the same as before
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                for line in f:
-                    if ',' in line:
-                        parts = line.strip().split(',')
-                        name = parts[0].strip()
-                        try:
-                            cid = int(parts[1].strip())
-                            self.classes_map[name] = cid
-                            self.id_to_name_map[cid] = name
-                        except: pass
+        # Parsed once per process; every window shares the same read-only maps
+        self.classes_map, self.id_to_name_map = load_class_map(resource_path("id_list.txt"))
+        # The class list is fixed from here on: build the dialog choices once
+        sorted_ids = sorted(self.id_to_name_map)
+        self.class_items = [f"{cid}: {self.id_to_name_map[cid]}" for cid in sorted_ids]
+        self.class_item_index = {cid: i for i, cid in enumerate(sorted_ids)}
 
     # --- WORKFLOW LOGIC ---
 
 
     def run_interpolation(self):
+        self.flush_pending_save()
         # 1. Get Selected Track from the Folder List (Bottom Right)
         item = self.list_folder_objects.currentItem()
         if not item:
@@ -1498,9 +2031,10 @@ class MainWindow(qtw.QMainWindow):
 
         # if reply == qtw.QMessageBox.No: return
 
-        # 3. Run Logic
-        count = self.manager.interpolate_track(track_id, self.json_folder, self.frame_files)
+        # 3. Run Logic (in the background)
+        self.start_interpolation([track_id], self.on_interpolation_finished)
 
+    def on_interpolation_finished(self, tracks_processed, count):
         # 4. Feedback
         qtw.QMessageBox.information(self, "Success", f"Interpolation complete.\nAdded {count} new bounding boxes.")
 
@@ -1568,56 +2102,102 @@ class MainWindow(qtw.QMainWindow):
 
     def refresh_lists(self):
         # 1. Refresh Frame List
-        self.list_frame_objects.clear()
-        for bid, data in self.manager.boxes.items():
-            cid = data.get('class')
-            tid = data.get('track_id')
-            cname = self.id_to_name_map.get(cid, "Unknown")
-            item = qtw.QListWidgetItem(f"Track {tid} : {cname}")
-            item.setData(qtc.Qt.UserRole, bid)
-            pix = qtg.QPixmap(16, 16)
-            pix.fill(get_color_for_id(tid))
-            item.setIcon(qtg.QIcon(pix))
-            self.list_frame_objects.addItem(item)
+        frame_rows = [(bid, data.get('track_id'), data.get('class')) for bid, data in self.manager.boxes.items()]
+        self.fill_list(self.list_frame_objects, frame_rows, self.list_items_by_bid)
 
         # 2. Refresh Folder List (Master List)
         # Note: We don't clear this every frame usually, but to ensure new tracks created 
         # in this frame appear immediately, we reload it from manager.folder_unique_tracks
-        self.list_folder_objects.clear()
-        # Sort by Track ID
-        sorted_tracks = sorted(self.manager.folder_unique_tracks.items())
-        
-        for tid, cid in sorted_tracks:
-            cname = self.id_to_name_map.get(cid, "Unknown")
-            item = qtw.QListWidgetItem(f"Track {tid} : {cname}")
-            item.setData(qtc.Qt.UserRole, tid)
-            pix = qtg.QPixmap(16, 16)
-            pix.fill(get_color_for_id(tid))
-            item.setIcon(qtg.QIcon(pix))
-            self.list_folder_objects.addItem(item)
+        # Sort by Track ID -- only when the tracks differ from what the list already shows
+        tracks = self.manager.folder_unique_tracks
+        if tracks == self.folder_tracks_shown:
+            folder_rows = self.list_snapshots[self.list_folder_objects]
+        else:
+            folder_rows = [(tid, tid, cid) for tid, cid in sorted(tracks.items())]
+            self.folder_tracks_shown = dict(tracks)
+        self.fill_list(self.list_folder_objects, folder_rows)
+
+    def fill_list(self, list_widget, rows, index=None):
+        """
+        Fills an object list from (user_data, track_id, class_id) rows.
+        Updates the list against its last fill: rows whose user_data disappeared are removed,
+        new ones inserted, changed ones relabelled; unchanged items are kept. The selection is reset.
+        If given, index is kept as {user_data: QListWidgetItem}.
+        """
+        rows = tuple(rows)
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            old = self.list_snapshots.get(list_widget)
+            if old == rows:
+                list_widget.clearSelection()
+                list_widget.setCurrentRow(-1)
+                return
+            old = old or ()
+            
+            # 1. Drop the rows that are gone (bottom up, so row numbers stay valid)
+            new_keys = {data for data, tid, cid in rows}
+            for row in range(len(old) - 1, -1, -1):
+                if old[row][0] not in new_keys:
+                    list_widget.takeItem(row)
+                    if index is not None: index.pop(old[row][0], None)
+            kept = [r for r in old if r[0] in new_keys]
+            
+            # 2. Survivors must already be in the new order, otherwise start over
+            kept_keys = {r[0] for r in kept}
+            if [r[0] for r in kept] != [r[0] for r in rows if r[0] in kept_keys]:
+                list_widget.clear()
+                if index is not None: index.clear()
+                kept = []
+            
+            # 3. Walk the new rows: relabel changed survivors, insert the rest in place
+            j = 0
+            for row, (data, tid, cid) in enumerate(rows):
+                if j < len(kept) and kept[j][0] == data:
+                    if kept[j] != (data, tid, cid):
+                        item = list_widget.item(row)
+                        item.setIcon(get_icon_for_id(tid))
+                        item.setText(self.list_item_text(tid, cid))
+                    j += 1
+                    continue
+                item = qtw.QListWidgetItem(get_icon_for_id(tid), self.list_item_text(tid, cid))
+                item.setData(qtc.Qt.UserRole, data)
+                list_widget.insertItem(row, item)
+                if index is not None: index[data] = item
+            
+            list_widget.clearSelection()
+            list_widget.setCurrentRow(-1)
+            self.list_snapshots[list_widget] = rows
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+
+    def list_item_text(self, tid, cid):
+        return f"Track {tid} : {self.id_to_name_map.get(cid, 'Unknown')}"
 
     def sync_selection_from_scene(self, box_id):
         """Scene Box Clicked -> Select in Frame List."""
-        for i in range(self.list_frame_objects.count()):
-            item = self.list_frame_objects.item(i)
-            if item.data(qtc.Qt.UserRole) == box_id:
-                self.list_frame_objects.setCurrentItem(item)
-                break
+        # Qt reports one click several times (selection change + mouse release): skip if already synced
+        current = self.list_frame_objects.currentItem()
+        if current is not None and current.data(qtc.Qt.UserRole) == box_id:
+            return
+        item = self.list_items_by_bid.get(box_id)
+        if item is not None:
+            self.list_frame_objects.setCurrentItem(item)
 
     def on_frame_list_item_clicked(self, item):
         """Frame List Item Clicked -> Select in Scene."""
         box_id = item.data(qtc.Qt.UserRole)
-        for gitem in self.scene.items():
-            if isinstance(gitem, BoxItem):
-                gitem.setSelected(False)
-        for gitem in self.scene.items():
-            if isinstance(gitem, BoxItem) and gitem.box_id == box_id:
-                gitem.setSelected(True)
-                return
+        for gitem in self.scene.selectedItems():
+            gitem.setSelected(False)
+        target = self.box_items.get(box_id)
+        if target is not None:
+            target.setSelected(True)
 
     # --- STANDARD FILE OPS ---
 
     def open_folder(self):
+        self.flush_pending_save()
         folder = qtw.QFileDialog.getExistingDirectory(self, "Select Image Folder")
         if not folder: return
         
@@ -1645,37 +2225,174 @@ class MainWindow(qtw.QMainWindow):
         self.manager.scan_folder(self.json_folder)
         
         # Load Images
-        files = sorted(os.listdir(folder))
-        self.frame_files = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
+        # One scandir pass, filtered while iterating; only the image names get sorted
+        # ('.' check first: rpartition returns a dotless name, e.g. "png", whole as its extension)
+        with os.scandir(folder) as it:
+            self.frame_files = sorted(e.name for e in it
+                                      if '.' in e.name and e.name.rpartition('.')[2].lower() in IMAGE_EXTENSIONS
+                                      and e.is_file())
+        self.json_names = json_names_for(self.frame_files)
         if self.frame_files:
             self.current_frame_idx = 0
             self.load_frame()
 
     
     def load_frame(self):
+        # Write any pending edit before the manager switches to another file
+        self.flush_pending_save()
         filename = self.frame_files[self.current_frame_idx]
         self.lbl_filename.setText(f"{filename} ({self.current_frame_idx + 1}/{len(self.frame_files)})")
         
         path = os.path.join(self.current_image_folder, filename)
-        pixmap = qtg.QPixmap(path)
-        self.scene.clear()
-        self.scene.addPixmap(pixmap)
-        self.scene.setSceneRect(0, 0, pixmap.width(), pixmap.height())
-        self.view.fitInView(self.scene.sceneRect(), qtc.Qt.KeepAspectRatio)
+        pixmap, full_size = self.get_frame_pixmap(path)
+        self.set_background(pixmap, full_size)
+        self.scene.setSceneRect(0, 0, full_size.width(), full_size.height())
+        self.fit_view()
         
-        json_path = os.path.join(self.json_folder, os.path.splitext(filename)[0] + ".json")
+        json_path = os.path.join(self.json_folder, self.json_names[self.current_frame_idx])
         self.manager.load_from_file(json_path)
         
-        for bid, data in self.manager.boxes.items():
-            coords = data['box']
-            rect = qtc.QRectF(coords[0], coords[1], coords[2]-coords[0], coords[3]-coords[1])
-            self.draw_box_on_scene(bid, rect, data.get('class'), data.get('track_id'))
+        # Diff the new frame's boxes against the items already on the scene:
+        # remove vanished ids, retarget ids present on both frames, create only the new ones.
+        # Scene signals and view updates are suspended meanwhile: one repaint instead of one per box.
+        self.view.setUpdatesEnabled(False)
+        self.scene.blockSignals(True)
+        try:
+            for bid in list(self.box_items):
+                if bid not in self.manager.boxes:
+                    item = self.box_items.pop(bid)
+                    self.scene.removeItem(item)
+                    if len(self.box_item_pool) < 64:
+                        self.box_item_pool.append(item)
+
+            for bid, data in self.manager.boxes.items():
+                coords = data['box']
+                rect = qtc.QRectF(coords[0], coords[1], coords[2]-coords[0], coords[3]-coords[1])
+                item = self.box_items.get(bid)
+                if item is not None:
+                    item.retarget(rect, data.get('track_id'))
+                else:
+                    self.draw_box_on_scene(bid, rect, data.get('class'), data.get('track_id'))
+        finally:
+            self.scene.blockSignals(False)
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
             
         self.refresh_lists()
 
+        # Decode the neighbouring frames in the background
+        self.prefetch_frames(self.current_frame_idx)
+
+    def get_frame_image(self, path):
+        """Returns (image, native size) of a frame, from the prefetch cache when possible."""
+        entry = self.frame_cache.get(path)
+        if entry is None:
+            entry = read_frame_image(path, self.get_decode_size())
+            self.cache_frame(path, *entry)
+        else:
+            self.frame_cache.move_to_end(path)
+        return entry
+
+    def get_decode_size(self):
+        if self.frame_decode_size is None:
+            vp = self.view.viewport()
+            self.frame_decode_size = vp.size() * vp.devicePixelRatio()
+        return self.frame_decode_size
+
+    def get_frame_pixmap(self, path):
+        """
+        Returns (pixmap, native size) of a frame. Converted pixmaps live in QPixmapCache,
+        keyed by path and decode size, so revisits skip both the decode and the conversion.
+        """
+        size = self.get_decode_size()
+        key = f"{path}@{size.width()}x{size.height()}"
+        pixmap = qtg.QPixmapCache.find(key)
+        full_size = self.frame_sizes.get(path)
+        if pixmap is None or full_size is None:
+            img, full_size = self.get_frame_image(path)
+            pixmap = qtg.QPixmap.fromImage(img)
+            qtg.QPixmapCache.insert(key, pixmap)
+            self.frame_sizes[path] = full_size
+        return pixmap, full_size
+
+    def set_background(self, pixmap, full_size):
+        """Shows a (possibly downscaled) frame stretched over its native-resolution scene rect."""
+        self.bg_item.setPixmap(pixmap)
+        self.bg_item.setScale(full_size.width() / pixmap.width() if pixmap.width() else 1.0)
+        self.bg_full_res = pixmap.size() == full_size
+
+    def on_view_zoomed(self):
+        # Zoomed past the decoded resolution: swap in the native-size frame
+        if self.bg_full_res or not self.frame_files: return
+        dpr = self.view.viewport().devicePixelRatio()
+        if self.view.transform().m11() * self.bg_item.scale() * dpr <= 1.0: return
+        path = os.path.join(self.current_image_folder, self.frame_files[self.current_frame_idx])
+        img, full_size = read_frame_image(path)
+        self.set_background(qtg.QPixmap.fromImage(img), full_size)
+
+    def view_state(self):
+        return (self.scene.sceneRect(), self.view.transform(),
+                self.view.horizontalScrollBar().value(), self.view.verticalScrollBar().value(),
+                self.view.viewport().size())
+
+    def fit_view(self):
+        """Fits the frame into the view, unless it is still exactly as the last fit left it."""
+        if self.view_fit is not None and self.view_fit == self.view_state(): return
+        self.view.fitInView(self.scene.sceneRect(), qtc.Qt.KeepAspectRatio)
+        self.view_fit = self.view_state()
+
+    def on_view_resized(self):
+        # Follow the new viewport size (part of the view state), unless the user has zoomed away from the fitted view
+        if self.view_fit is not None and self.view_fit[1] == self.view.transform():
+            self.fit_view()
+        vp = self.view.viewport()
+        size = vp.size() * vp.devicePixelRatio()
+        if size == self.frame_decode_size: return
+        # Cached and in-flight frames were decoded for the old size
+        self.frame_decode_size = size
+        self.frame_cache.clear()
+        self.frame_requests.clear()
+        if self.frame_files and not self.bg_full_res:
+            path = os.path.join(self.current_image_folder, self.frame_files[self.current_frame_idx])
+            self.set_background(*self.get_frame_pixmap(path))
+
+    def cache_frame(self, path, img, full_size):
+        self.frame_cache[path] = (img, full_size)
+        self.frame_cache.move_to_end(path)
+        while len(self.frame_cache) > self.frame_cache_size:
+            self.frame_cache.popitem(last=False)
+
+    def prefetch_frames(self, idx):
+        pool = qtc.QThreadPool.globalInstance()
+        radius = self.prefetch_radius
+        for i in range(idx - radius, idx + radius + 1):
+            if i == idx or not 0 <= i < len(self.frame_files): continue
+            path = os.path.join(self.current_image_folder, self.frame_files[i])
+            if path in self.frame_cache:
+                # Keep cached neighbours from being evicted first
+                self.frame_cache.move_to_end(path)
+                continue
+            if path in self.frame_requests: continue
+            self.frame_requests[path] = i
+            pool.start(FrameLoader(path, self.get_decode_size(), self.frame_loader_signals))
+
+    def on_frame_prefetched(self, path, img, full_size):
+        idx = self.frame_requests.pop(path, None)
+        # Drop results for frames we have already navigated away from
+        if idx is None or abs(idx - self.current_frame_idx) > self.prefetch_radius: return
+        if not img.isNull():
+            self.cache_frame(path, img, full_size)
+
     def draw_box_on_scene(self, bid, rect, cid, tid):
-        item = BoxItem(rect, bid, tid, self.manager, self)
+        if self.box_item_pool:
+            # Recycle an item from an earlier frame instead of building new graphics items
+            item = self.box_item_pool.pop()
+            item.box_id = bid
+            item.retarget(rect, tid)
+        else:
+            item = BoxItem(rect, bid, tid, self.manager, self)
         self.scene.addItem(item)
+        self.box_items[bid] = item
 
     def next_frame(self):
         if self.current_frame_idx < len(self.frame_files) - 1:
@@ -1688,7 +2405,29 @@ class MainWindow(qtw.QMainWindow):
             self.load_frame()
 
     def save_data(self):
+        self.save_timer.stop()
         self.manager.save_to_file()
+
+    def schedule_save(self):
+        """Saves after 250 ms without further edits (restarts the countdown on each call)."""
+        self.save_timer.start(250)
+
+    def flush_pending_save(self):
+        """Writes a scheduled save right away. Call before reading annotation files from disk."""
+        if self.save_timer.isActive():
+            self.save_data()
+
+    def closeEvent(self, event):
+        self.flush_pending_save()
+        # An interpolation run stops after its current track and finishes its writes
+        if self.interp_thread is not None:
+            self.interp_thread.requestInterruption()
+            self.interp_thread.wait()
+        # Let in-flight prefetches finish before their signal object goes away
+        pool = qtc.QThreadPool.globalInstance()
+        pool.clear()
+        pool.waitForDone()
+        super().closeEvent(event)
         
     def delete_selected_box(self):
         items = self.scene.selectedItems()
@@ -1702,20 +2441,17 @@ class MainWindow(qtw.QMainWindow):
                 tid = self.manager.delete_box(item.box_id)
                 if tid is not None:
                     deleted_tracks.add(tid)
+                self.box_items.pop(item.box_id, None)
                 self.scene.removeItem(item)
         
         # 2. Save to Disk immediately
         self.save_data()
         
         # 3. Check for "Extinct" Tracks
+        # Tracks of the boxes left on this frame, collected once for all deleted tracks
+        frame_tracks = {data.get('track_id') for data in self.manager.boxes.values()}
         for tid in deleted_tracks:
-            still_in_current_frame = False
-            for data in self.manager.boxes.values():
-                if data.get('track_id') == tid:
-                    still_in_current_frame = True
-                    break
-            
-            if not still_in_current_frame:
+            if tid not in frame_tracks:
                 exists_globally = self.manager.check_track_used_globally(tid, self.json_folder)
                 if not exists_globally:
                     if tid in self.manager.folder_unique_tracks:
@@ -1723,15 +2459,9 @@ class MainWindow(qtw.QMainWindow):
 
         # --- 4. RECALCULATE NEXT ID (The Fix) ---
         # We look at all tracks currently existing in the folder.
-        # The next suggestion should be (Highest_ID + 1).
-        if self.manager.folder_unique_tracks:
-            # Ensure keys are integers for correct max() calculation
-            existing_ids = [int(k) for k in self.manager.folder_unique_tracks.keys()]
-            max_id = max(existing_ids)
-            self.manager.next_suggestion_track_id = max_id + 1
-        else:
-            # If folder is empty, reset to 1
-            self.manager.next_suggestion_track_id = 1
+        # The next suggestion should be (Highest_ID + 1), or 1 if the folder is empty.
+        # Track ids are ints as read from the JSON files: max() runs over the keys directly
+        self.manager.next_suggestion_track_id = max(self.manager.folder_unique_tracks, default=0) + 1
 
         # 5. Refresh UI
         self.refresh_lists()